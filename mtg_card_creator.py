@@ -1,11 +1,26 @@
+import argparse
+import hashlib
+import io
+import itertools
+import json
 import os
+import shutil
+import subprocess
+import textwrap
+import threading
+import uuid
 import requests
-from config import openai_api_key, google_creds_file, spreadsheet_id, folder_id, username, password
+from collections import namedtuple
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import openai_api_key, google_creds_file, spreadsheet_id, folder_id
 from PIL import Image
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from openai import OpenAI
+from openai import OpenAI, RateLimitError, APIConnectionError, InternalServerError
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -16,7 +31,121 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
-import time
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+# Per-stage concurrency for the art pipeline. Generation and upload are bounded by
+# the OpenAI rate limit and Drive's ~10 writes/s per user, so keep them narrower.
+GENERATE_WORKERS = 8
+DOWNLOAD_WORKERS = 16
+ENCODE_WORKERS = 4
+UPLOAD_WORKERS = 8
+
+# Drive statuses worth retrying: rate limits (429) and server errors. A 403 is retried only for the reasons in
+# RETRYABLE_DRIVE_403_REASONS; other 403s (permissions, storage quota) would fail the same way again.
+RETRYABLE_DRIVE_STATUSES = {429, 500, 502, 503, 504}
+RETRYABLE_DRIVE_403_REASONS = {'userRateLimitExceeded', 'rateLimitExceeded'}
+
+def _is_retryable_error(exception):
+    """
+    Tells whether a failed OpenAI or Drive call is transient and worth retrying.
+
+    Parameters:
+    exception (Exception): The exception raised by the call.
+
+    Returns:
+    bool: True for rate limits, failures to connect and server errors.
+    """
+    if isinstance(exception, requests.RequestException) and not isinstance(exception, requests.HTTPError):
+        # A Drive upload is a single POST that creates the file. Once the request may have reached Drive (a read
+        # timeout, a connection dropped mid-response), a retry could leave a duplicate in the folder, so only failures
+        # to connect are retried. urllib3 reports refused connections and DNS failures as ConnectTimeoutError too.
+        reason = getattr(exception.args[0], 'reason', None) if exception.args else None
+        return isinstance(exception, requests.ConnectTimeout) or isinstance(reason, ConnectTimeoutError)
+    if isinstance(exception, requests.HTTPError):
+        if exception.response.status_code == 403:
+            try:
+                reason = exception.response.json()['error']['errors'][0]['reason']
+            except (ValueError, KeyError, IndexError, TypeError):
+                return False
+            return reason in RETRYABLE_DRIVE_403_REASONS
+        return exception.response.status_code in RETRYABLE_DRIVE_STATUSES
+    return isinstance(exception, (RateLimitError, APIConnectionError, InternalServerError))
+
+_backoff = wait_exponential_jitter(initial=1, max=60)
+
+def _wait_for_retry(retry_state):
+    """
+    Returns how long to wait before retrying: the server's Retry-After when it sends one, jittered exponential backoff otherwise.
+
+    Parameters:
+    retry_state (RetryCallState): The tenacity state of the failed call.
+
+    Returns:
+    float: The delay in seconds.
+    """
+    response = getattr(retry_state.outcome.exception(), 'response', None)
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return min(float(retry_after), 60)
+    except (TypeError, ValueError):
+        return _backoff(retry_state)  # No header, or an HTTP date rather than seconds
+
+# Retries rate-limited and failed API calls before giving up on a card
+api_retry = retry(
+    retry=retry_if_exception(_is_retryable_error),
+    stop=stop_after_attempt(6),
+    wait=_wait_for_retry,
+    reraise=True
+)
+
+# Drive multipart upload endpoint: metadata and media in one request, recommended for files up to 5 MB
+DRIVE_UPLOAD_URL = 'https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart&fields=id'
+
+# Sheet column index of each card field (column A is 0)
+CARD_COLUMNS = {
+    'filename': 1,
+    'prompt': 2,
+    'card_type': 3,
+    'subtype': 5,
+    'mana_value': 10,
+    'power': 11,
+    'toughness': 12,
+    'static_abilities': 13,
+    'triggered_abilities_1': 14,
+    'triggered_abilities_2': 15,
+    'triggered_abilities_3': 16,
+    'triggered_abilities_4': 17,
+    'rarity': 18,
+    'flavor': 20,
+}
+Card = namedtuple('Card', CARD_COLUMNS)
+
+# Local copy of the card rows, reused while the spreadsheet's Drive version is unchanged
+SHEET_CACHE_FILE = './.cache/sheet.json'
+
+# Encoded art of every generated prompt, so a repeated prompt never pays for a second DALL·E image
+ART_CACHE_DIR = './.cache/dalle'
+
+# Default number of Chrome instances creating cards in parallel, each with its own logged-in session.
+CARD_WORKERS = 4
+
+# Chrome profiles live here so MTGCardsmith session cookies survive between runs. Chrome locks a profile while it is
+# open, so every worker gets its own subdirectory.
+CHROME_PROFILE_DIR = './chrome_profile'
+
+# MTGCardsmith page element locators
+LOGOUT_LINK = (By.CSS_SELECTOR, "a[href*='logout']")
+USERNAME_INPUT = (By.ID, "username")
+PASSWORD_INPUT = (By.ID, "password")
+LOGIN_BTN = (By.CSS_SELECTOR, "input[type='submit'][value='Login']")
+FILE_INPUT = (By.CSS_SELECTOR, "input[type='file']")
+CONFIRM_BTN = (By.CSS_SELECTOR, ".slim-editor-btn.slim-btn-confirm")
+NEXT_BTN = (By.CSS_SELECTOR, "input[type='submit'][value='Next']")
+NAME_INPUT = (By.CSS_SELECTOR, "input[name='name']")
+CARD_TYPE_CHOICE = (By.ID, "select2-chosen-2")
+CARD_TYPE_SEARCH = (By.ID, "s2id_autogen2_search")
+PREVIEW_BTN = (By.CSS_SELECTOR, "input[value='Preview Card']")
+PUBLISH_BTN = (By.CSS_SELECTOR, "a[href='/src/actions/save']")
 
 class MTGCardArtCreator:
     """
@@ -31,8 +160,15 @@ class MTGCardArtCreator:
     creds (Credentials): Google service account credentials.
     sheet_service (Resource): The Google Sheets API service instance.
     drive_service (Resource): The Google Drive API service instance.
+    drive_http (AuthorizedSession): Pooled, authorized HTTP session used to upload images to Drive.
+    image_model (str): The OpenAI image model used to generate art.
+    image_size (str): The size of the generated images.
+    row_start (int): The first sheet row to process.
+    row_end (int): The last sheet row to process, or None for the rest of the sheet.
+    generate_workers (int): The number of DALL·E requests kept in flight.
+    http (Session): Pooled HTTP session used to download generated images.
     """
-    def __init__(self, openai_api_key, google_creds_file, spreadsheet_id, folder_id):
+    def __init__(self, openai_api_key, google_creds_file, spreadsheet_id, folder_id, image_model="dall-e-3", image_size="1024x1024", row_start=2, row_end=None, generate_workers=GENERATE_WORKERS):
         """
         Initializes the MTGCardArtCreator with the necessary credentials and IDs.
 
@@ -41,8 +177,24 @@ class MTGCardArtCreator:
         google_creds_file (str): Path to the Google service account credentials file.
         spreadsheet_id (str): The ID of the Google Sheets spreadsheet containing card information.
         folder_id (str): The ID of the Google Drive folder where images will be uploaded.
+        image_model (str, optional): The OpenAI image model. Defaults to "dall-e-3".
+        image_size (str, optional): The size to request. dall-e-3 starts at "1024x1024"; with "dall-e-2", "512x512" is
+            already under the 900x900 card limit and never needs resizing. Defaults to "1024x1024".
+        row_start (int, optional): The first sheet row to process. Defaults to 2, the row after the header.
+        row_end (int, optional): The last sheet row to process. Defaults to None (through the end of the sheet).
+        generate_workers (int, optional): The number of DALL·E requests kept in flight; raise it to match the account's
+            image rate limit. Defaults to GENERATE_WORKERS.
         """
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = OpenAI(api_key=openai_api_key, max_retries=0)  # Retries are handled by api_retry
+        self.image_model = image_model
+        self.image_size = image_size
+        self.row_start = row_start
+        self.row_end = row_end
+        self.generate_workers = generate_workers
+        # Created once here; image paths are built from the absolute directory so later consumers need no abspath
+        os.makedirs('./images', exist_ok=True)
+        os.makedirs(ART_CACHE_DIR, exist_ok=True)
+        self._images_dir = os.path.abspath('./images')
         self.spreadsheet_id = spreadsheet_id
         self.folder_id = folder_id
         self.creds = service_account.Credentials.from_service_account_file(
@@ -51,77 +203,314 @@ class MTGCardArtCreator:
         )
         self.sheet_service = build('sheets', 'v4', credentials=self.creds)
         self.drive_service = build('drive', 'v3', credentials=self.creds)
+        # Uploads bypass googleapiclient and go through AuthorizedSession, which is built on requests/urllib3 and so
+        # speaks HTTP/1.1: one request per connection at a time, with no HTTP/2 multiplexing. Concurrency comes from
+        # the pool instead, which keeps one keep-alive connection per upload worker.
+        self.drive_http = AuthorizedSession(self.creds)
+        self.drive_http.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=UPLOAD_WORKERS))
+        # Keep-alive connections to the image CDN. pool_connections counts hosts, pool_maxsize the sockets kept per
+        # host, which only needs to cover the download workers.
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=DOWNLOAD_WORKERS,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        ))
 
     def adjust_image_size(self, image_path):
         """
-        Adjusts the size of an image to a maximum of 900x900 pixels and saves it.
+        Adjusts the size of an image to a maximum of 900x900 pixels and saves it as a JPEG.
+
+        Only the image header is read for images already within bounds, which are left untouched.
 
         Parameters:
         image_path (str): The path to the image file to be adjusted.
         """
         with Image.open(image_path) as img:
             size = (900, 900)
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            img.save(image_path, optimize=True)
+            if img.width <= size[0] and img.height <= size[1]:
+                return
+            # Let libjpeg downscale by 1/2, 1/4 or 1/8 while decoding; BILINEAR is enough for what remains
+            img.draft('RGB', size)
+            img.thumbnail(size, Image.Resampling.BILINEAR)
+            img.save(image_path, 'JPEG', quality=85, progressive=True, subsampling=2)
+
+    @api_retry
+    def _generate_image(self, prompt):
+        """
+        Generates an image with OpenAI's DALL·E.
 
-    def generate_and_upload_images(self):
+        Parameters:
+        prompt (str): The prompt describing the card art.
+
+        Returns:
+        str: The URL of the generated image.
         """
-        Generates and uploads images based on the prompts from the Google Sheets spreadsheet.
+        options = {'quality': "standard"} if self.image_model == "dall-e-3" else {}  # quality is a dall-e-3 option
+        response = self.client.images.generate(model=self.image_model, prompt=prompt, size=self.image_size, n=1, **options)
+        return response.data[0].url
+
+    def _download_image(self, image_url, image_path):
+        """
+        Streams a generated image to disk without holding the whole file in memory.
+
+        Parameters:
+        image_url (str): The URL of the generated image.
+        image_path (str): The path the image is written to.
+        """
+        with self.http.get(image_url, stream=True, timeout=(5, 60)) as image_response:
+            image_response.raise_for_status()
+            image_response.raw.decode_content = True
+            with open(image_path, 'wb') as file:
+                shutil.copyfileobj(image_response.raw, file, length=1 << 16)
+
+    def _art_cache_path(self, prompt):
+        """
+        Returns where the art for a prompt is cached. The model and size are part of the key, since they change the image.
 
-        Iterates through a specific range in the 'Cards' sheet, generates images using OpenAI's DALL·E, and uploads them to Google Drive.
+        Parameters:
+        prompt (str): The prompt describing the card art.
+
+        Returns:
+        str: The path of the cached JPEG in ART_CACHE_DIR.
+        """
+        key = hashlib.sha256(f'{self.image_model}|{self.image_size}|{prompt.strip()}'.encode()).hexdigest()
+        return os.path.join(ART_CACHE_DIR, f'{key}.jpg')
+
+    def _encode_image(self, source_path, image_path, cache_path):
+        """
+        Re-encodes a downloaded DALL·E PNG as a JPEG (quality 85), removes the PNG and keeps a copy in the art cache.
+
+        Parameters:
+        source_path (str): The path to the downloaded PNG.
+        image_path (str): The path the JPEG is written to.
+        cache_path (str): The art cache path for the card's prompt.
 
         Returns:
-        list: A list of dictionaries containing information about the created cards and their image paths.
+        bytes: The JPEG as written to image_path, handed to the upload stage so it does not read the file back.
         """
-        range_name = 'Cards'  # Adjust as needed
-        result = self.sheet_service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=range_name).execute()
+        # Encode in memory so the JPEG size is known without a stat and the bytes can be reused for the upload
+        buffer = io.BytesIO()
+        with Image.open(source_path) as img:
+            img.convert('RGB').save(buffer, 'JPEG', quality=85, optimize=True, progressive=True)
+        image_bytes = buffer.getvalue()
+        with open(image_path, 'wb') as file:
+            file.write(image_bytes)
+
+        # A 1024x1024 JPEG at quality 85 is well under 2 MB; this only catches unusually large outputs
+        if len(image_bytes) > 2 * 1024 * 1024:
+            self.adjust_image_size(image_path)
+            with open(image_path, 'rb') as file:
+                image_bytes = file.read()
+
+        # Written under a unique temporary name and renamed into place, so a reader never sees a half-written JPEG
+        temp_path = f'{cache_path}.{uuid.uuid4().hex}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(image_bytes)
+        os.replace(temp_path, cache_path)
+        os.remove(source_path)
+        return image_bytes
+
+    @api_retry
+    def _upload_image(self, image_path, filename, image_bytes=None):
+        """
+        Uploads an image to the Google Drive folder with a single multipart request to the upload endpoint.
+
+        Parameters:
+        image_path (str): The path to the image file.
+        filename (str): The card filename, used as the name of the Drive file.
+        image_bytes (bytes, optional): The image contents, if already in memory. Read from image_path if not given.
+
+        Returns:
+        str: The ID of the uploaded Drive file.
+        """
+        # Name and parent folder travel in the same request as the media, so there is no follow-up metadata call to
+        # batch. Media uploads cannot be batched either: Drive's batch endpoint only accepts metadata calls.
+        file_metadata = {'name': f'{filename}.jpg', 'mimeType': 'image/jpeg', 'parents': [self.folder_id]}
+        if image_bytes is None:
+            with open(image_path, 'rb') as file:
+                image_bytes = file.read()
+        boundary = uuid.uuid4().hex
+        body = b''.join([
+            f'--{boundary}\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n'.encode(),
+            json.dumps(file_metadata).encode(),
+            f'\r\n--{boundary}\r\nContent-Type: image/jpeg\r\n\r\n'.encode(),
+            image_bytes,
+            f'\r\n--{boundary}--\r\n'.encode(),
+        ])
+        response = self.drive_http.post(
+            DRIVE_UPLOAD_URL, data=body, headers={'Content-Type': f'multipart/related; boundary={boundary}'}, timeout=(5, 60)
+        )
+        response.raise_for_status()
+        file_id = response.json()['id']
+        print(f"Uploaded {filename}.jpg with ID: {file_id}")
+        return file_id
+
+    def _upload_cached_image(self, cache_path, image_path, filename):
+        """
+        Copies cached art to a card's image path and uploads it, so a failed copy is reported for that card alone.
+
+        Parameters:
+        cache_path (str): The art cache path for the card's prompt.
+        image_path (str): The path the JPEG is copied to.
+        filename (str): The card filename, used as the name of the Drive file.
+
+        Returns:
+        str: The ID of the uploaded Drive file.
+        """
+        shutil.copyfile(cache_path, image_path)
+        return self._upload_image(image_path, filename)
+
+    @staticmethod
+    def _parse_card(row):
+        """
+        Parses a spreadsheet row into a Card. Trailing empty cells, which the Sheets API omits, become empty strings.
+
+        Parameters:
+        row (list): A row from the 'Cards' sheet.
+
+        Returns:
+        Card: The card's fields as strings.
+        """
+        return Card._make(str(row[index]) if index < len(row) else '' for index in CARD_COLUMNS.values())
+
+    def _image_path(self, filename, extension='jpg'):
+        """
+        Returns the absolute path of a card's image in the images directory.
+
+        Parameters:
+        filename (str): The card filename.
+        extension (str, optional): The file extension. Defaults to 'jpg'.
+
+        Returns:
+        str: The absolute image path.
+        """
+        return os.path.join(self._images_dir, f'{filename}.{extension}')
+
+    def _build_card_info(self, card):
+        """
+        Builds the card information dictionary consumed by MTGCardCreator.
+
+        Parameters:
+        card (Card): The parsed card.
+
+        Returns:
+        dict: The card's image path, title and other text fields.
+        """
+        other_text_fields = card._asdict()
+        del other_text_fields['filename'], other_text_fields['prompt']
+        return {
+            'image_path': self._image_path(card.filename),
+            'card_title': card.filename,
+            'other_text_fields': other_text_fields
+        }
+
+    def _read_card_rows(self):
+        """
+        Reads the card rows from the 'Cards' sheet, reusing SHEET_CACHE_FILE while the spreadsheet is unchanged.
+
+        Returns:
+        list: The rows from row_start to row_end of the 'Cards' sheet, columns A through U.
+        """
+        # Columns past U ('flavor') are never used
+        range_name = f"Cards!A{self.row_start}:U{self.row_end if self.row_end else ''}"
+        # Drive bumps a file's version on every change, including edits made in the Sheets UI
+        version = self.drive_service.files().get(fileId=self.spreadsheet_id, fields='version').execute().get('version')
+        try:
+            with open(SHEET_CACHE_FILE) as file:
+                cached = json.load(file)
+            if cached.get('version') == version and cached.get('range') == range_name:
+                return cached['values']
+        except (OSError, ValueError):
+            pass  # No usable cache; read the sheet
+
+        result = self.sheet_service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id, range=range_name, majorDimension='ROWS', valueRenderOption='UNFORMATTED_VALUE'
+        ).execute()
         values = result.get('values', [])
-        created_cards_info = []
+        os.makedirs(os.path.dirname(SHEET_CACHE_FILE), exist_ok=True)
+        with open(SHEET_CACHE_FILE, 'w') as file:
+            json.dump({'version': version, 'range': range_name, 'values': values}, file)
+        return values
 
-        for row in values[1:]:  # Assuming the first row contains headers
-            if len(row) >= 10 and row[2] is not None and row[2] != "":  # Ensure row has enough data and prompt is not null
-                filename, prompt = row[1], row[2]
-                try:
-                    response = self.client.images.generate(model="dall-e-3", prompt=prompt, size="1024x1024", quality="standard", n=1)
-                    image_url = response.data[0].url
-                    image_response = requests.get(image_url)
-                    if image_response.status_code == 200:
-                        image_path = f'./images/{filename}.jpg'
-                        os.makedirs(os.path.dirname(image_path), exist_ok=True)
-                        with open(image_path, 'wb') as file:
-                            file.write(image_response.content)
-
-                        if os.path.getsize(image_path) > 2 * 1024 * 1024:
-                            self.adjust_image_size(image_path)
-
-                        file_metadata = {'name': f'{filename}.jpg', 'mimeType': 'image/jpeg', 'parents': [self.folder_id]}
-                        media = MediaFileUpload(image_path, mimetype='image/jpeg')
-                        uploaded_file = self.drive_service.files().create(body=file_metadata, media_body=media, fields='id').execute()
-                        print(f"Uploaded {filename}.jpg with ID: {uploaded_file.get('id')}")
-
-                    card_info = {
-                        'image_path': f'./images/{filename}.jpg',
-                        'card_title': row[1],
-                        'other_text_fields': {
-                            'card_type': row[3],
-                            'subtype': row[5],
-                            'mana_value': row[10],
-                            'power': row[11],
-                            'toughness': row[12],
-                            'static_abilities': row[13],
-                            'triggered_abilities_1': row[14],
-                            'triggered_abilities_2': row[15],
-                            'triggered_abilities_3': row[16],
-                            'triggered_abilities_4': row[17],
-                            'rarity': row[18],
-                            'flavor': row[20]
-                        }
-                    }
-                    created_cards_info.append(card_info)
-                except Exception as e:
-                    print(f"Error processing '{filename}': {e}")
-
-        return created_cards_info
+    def generate_and_upload_images(self):
+        """
+        Generates and uploads images based on the prompts from the Google Sheets spreadsheet.
+
+        Rows from the 'Cards' sheet are pushed through a staged pipeline (generate, download, encode, upload), each stage
+        running on its own thread pool so that network waits of different rows overlap.
+
+        Yields:
+        dict: Information about each created card and its image path, as soon as its image is uploaded.
+        """
+        # Skip rows without enough data or without a prompt. Rows are processed concurrently and write to
+        # ./images/<filename>, so only the first row for each filename is kept.
+        cards = []
+        filenames = set()
+        for row in self._read_card_rows():
+            if len(row) >= 10 and row[2] is not None and row[2] != "":
+                card = self._parse_card(row)
+                if card.filename in filenames:
+                    print(f"Skipping duplicate card '{card.filename}'")
+                    continue
+                filenames.add(card.filename)
+                cards.append(card)
+
+        generate_pool = ThreadPoolExecutor(self.generate_workers)
+        download_pool = ThreadPoolExecutor(DOWNLOAD_WORKERS)
+        encode_pool = ThreadPoolExecutor(ENCODE_WORKERS)
+        upload_pool = ThreadPoolExecutor(UPLOAD_WORKERS)
+        try:
+            # Cards sharing a prompt share its art: each prompt is generated once, under the first card's filename,
+            # and the encoded JPEG is copied to the other cards of its group
+            groups = {}
+            for index, card in enumerate(cards):
+                groups.setdefault(self._art_cache_path(card.prompt), []).append(index)
+
+            pending = {}
+            for cache_path, indices in groups.items():
+                if os.path.exists(cache_path):
+                    # This prompt was generated by an earlier run (e.g. its upload failed); upload the cached art
+                    # instead of regenerating it. Whatever ./images holds is overwritten, since it may be stale art
+                    # for an old prompt or a JPEG left half-written by an interrupted run.
+                    for index in indices:
+                        image_path = self._image_path(cards[index].filename)
+                        pending[upload_pool.submit(self._upload_cached_image, cache_path, image_path, cards[index].filename)] = (index, 'upload')
+                else:
+                    pending[generate_pool.submit(self._generate_image, cards[indices[0]].prompt)] = (indices[0], 'generate')
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, stage = pending.pop(future)
+                    filename = cards[index].filename
+                    source_path = self._image_path(filename, 'png')
+                    image_path = self._image_path(filename)
+                    cache_path = self._art_cache_path(cards[index].prompt)
+                    try:
+                        stage_result = future.result()
+                        if stage == 'generate':
+                            pending[download_pool.submit(self._download_image, stage_result, source_path)] = (index, 'download')
+                        elif stage == 'download':
+                            pending[encode_pool.submit(self._encode_image, source_path, image_path, cache_path)] = (index, 'encode')
+                        elif stage == 'encode':
+                            for shared_index in groups[cache_path]:
+                                shared_filename = cards[shared_index].filename
+                                shared_path = self._image_path(shared_filename)
+                                if shared_index != index:
+                                    with open(shared_path, 'wb') as file:
+                                        file.write(stage_result)
+                                pending[upload_pool.submit(self._upload_image, shared_path, shared_filename, stage_result)] = (shared_index, 'upload')
+                        else:
+                            yield self._build_card_info(cards[index])
+                    except Exception as e:
+                        # Until the art is encoded, a failure leaves every card sharing the prompt without art
+                        for failed_index in ([index] if stage == 'upload' else groups[cache_path]):
+                            print(f"Error processing '{cards[failed_index].filename}': {e}")
+        finally:
+            # Drop queued work when the run stops early (Ctrl+C, an error, or the caller closing the generator), so
+            # DALL·E requests that have not started yet are never sent and billed. Normal runs get here with nothing queued.
+            for pool in (generate_pool, download_pool, encode_pool, upload_pool):
+                pool.shutdown(wait=False, cancel_futures=True)
 
 class MTGCardCreator:
     """
@@ -134,54 +523,128 @@ class MTGCardCreator:
     driver (WebDriver): The Selenium WebDriver instance.
     is_logged_in (bool): Flag indicating whether the user is logged in or not.
     """
-    def __init__(self, image_path, card_title, other_text_fields=None):
+    # Wait timeouts in seconds
+    _SESSION_CHECK_TIMEOUT = 3
+    _LOGIN_TIMEOUT = 10
+    _PAGE_LOAD_TIMEOUT = 10
+    _DROPDOWN_TIMEOUT = 10
+    _FORM_TIMEOUT = 20  # Upload, form and publish steps; used by self._wait
+
+    # Resolved once per process and shared by every driver; see get_chromedriver_path
+    _chromedriver_path = None
+    _chromedriver_lock = threading.Lock()
+
+    # Sets the plain form fields in one round trip, firing the input/change events the page's scripts listen for.
+    # Empty values are skipped so optional fields keep their defaults.
+    _FILL_FORM_SCRIPT = """
+        const fields = arguments[0];
+        const set = (selector, value) => {
+            const element = document.querySelector(selector);
+            if (!element || value === null || value === undefined || value === '') return;
+            Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set.call(element, value);
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        };
+        set("input[name='name']", fields.title);
+        set("input[name='custom_mana']", fields.mana);
+        set("textarea[name='description']", fields.description);
+        set("#rarity", fields.rarity);
+    """
+
+    def __init__(self, image_path=None, card_title=None, other_text_fields=None, driver=None, profile_dir=None, username=None, password=None):
         """
         Initializes the MTGCardCreator with an image path, card title, and optional text fields.
 
         Parameters:
-        image_path (str): The path to the card's image file.
-        card_title (str): The title of the MTG card.
+        image_path (str, optional): The path to the card's image file. Defaults to None.
+        card_title (str, optional): The title of the MTG card. Defaults to None.
         other_text_fields (dict, optional): Other text fields related to the card. Defaults to None.
+        driver (WebDriver, optional): The WebDriver to use. A new Chrome instance is started if not given.
+        profile_dir (str, optional): Chrome user data directory for a newly started driver. Defaults to None (temporary profile).
+        username (str, optional): MTGCardsmith username. Defaults to the MTGCS_USER environment variable.
+        password (str, optional): MTGCardsmith password. Defaults to the MTGCS_PASS environment variable.
         """
         self.image_path = image_path
         self.card_title = card_title
         self.other_text_fields = other_text_fields if other_text_fields else {}
-        self.driver = self.init_driver()
+        self.driver = driver if driver else self.init_driver(profile_dir)
         self.is_logged_in = False  # Flag to track login status
+        self._username = username if username else os.environ.get("MTGCS_USER")
+        self._password = password if password else os.environ.get("MTGCS_PASS")
+        self._wait = WebDriverWait(self.driver, self._FORM_TIMEOUT)
+
+    @classmethod
+    def get_chromedriver_path(cls):
+        """
+        Returns the chromedriver binary path. A path pinned in the CHROMEDRIVER_PATH environment variable is used as is;
+        otherwise ChromeDriverManager is asked once, on the first call.
+
+        Returns:
+        str: The path to the chromedriver executable.
+        """
+        with cls._chromedriver_lock:
+            if cls._chromedriver_path is None:
+                cls._chromedriver_path = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+            return cls._chromedriver_path
 
-    def init_driver(self):
+    def init_driver(self, profile_dir=None):
         """
         Initializes and returns a Selenium WebDriver instance with Chrome options.
 
+        Parameters:
+        profile_dir (str, optional): Chrome user data directory to persist cookies in. Defaults to None (temporary profile).
+
         Returns:
         WebDriver: The initialized Selenium WebDriver instance.
         """
         options = Options()
         options.add_experimental_option('excludeSwitches', ['enable-logging'])  # Suppress logging
-        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        # Run without a GUI; nothing on the page needs to be painted for the form to work
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--disable-extensions")
+        # Return from driver.get() at DOMContentLoaded; navigate_to_page waits for the elements it needs
+        options.page_load_strategy = 'eager'
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+        return webdriver.Chrome(service=Service(executable_path=self.get_chromedriver_path(), log_output=subprocess.DEVNULL), options=options)
 
     def login(self):
         """
-        Logs into the MTGCardsmith website using predefined credentials.
+        Logs into the MTGCardsmith website with the credentials given to __init__.
+
+        The credential form is skipped when the Chrome profile still holds a session from an earlier run.
         """
         if self.is_logged_in:  # Check if already logged in
             return  # Skip login if already logged in
 
-        username = username
-        password = password
+        self.driver.get("https://mtgcardsmith.com/")
+        try:
+            WebDriverWait(self.driver, self._SESSION_CHECK_TIMEOUT).until(EC.presence_of_element_located(LOGOUT_LINK))
+            self.is_logged_in = True
+            return
+        except TimeoutException:
+            pass
+
+        if not self._username or not self._password:
+            raise ValueError("MTGCardsmith credentials missing; set MTGCS_USER and MTGCS_PASS")
 
-        self.driver.get("https://mtgcardsmith.com/login")
-        time.sleep(2)
-        username_input = self.driver.find_element(By.ID, "username")
-        username_input.send_keys(username)
+        login_url = "https://mtgcardsmith.com/login"
+        self.driver.get(login_url)
+        login_wait = WebDriverWait(self.driver, self._LOGIN_TIMEOUT)
+        username_input = login_wait.until(EC.presence_of_element_located(USERNAME_INPUT))
+        username_input.send_keys(self._username)
 
-        password_input = self.driver.find_element(By.ID, "password")
-        password_input.send_keys(password)
+        password_input = self.driver.find_element(*PASSWORD_INPUT)
+        password_input.send_keys(self._password)
 
-        login_button = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='submit'][value='Login']"))
-        )
+        login_button = login_wait.until(EC.presence_of_element_located(LOGIN_BTN))
         login_button.click()
+        # Any redirect, including a failed login's, changes the URL; only a session shows the logout link
+        login_wait.until(EC.presence_of_element_located(LOGOUT_LINK))
         self.is_logged_in = True  # Update flag after successful login
 
     def navigate_to_page(self, url="https://mtgcardsmith.com/mtg-card-maker/"):
@@ -193,9 +656,7 @@ class MTGCardCreator:
         """
         self.driver.get(url)
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='file']"))
-            )
+            WebDriverWait(self.driver, self._PAGE_LOAD_TIMEOUT).until(EC.presence_of_element_located(FILE_INPUT))
         except TimeoutException:
             self.driver.execute_script("window.stop();")
 
@@ -204,42 +665,45 @@ class MTGCardCreator:
         Uploads an image for the card and confirms the upload on the MTGCardsmith website.
         """
         absolute_image_path = os.path.abspath(self.image_path)
-        file_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='file']")
+        file_input = self.driver.find_element(*FILE_INPUT)
         file_input.send_keys(absolute_image_path)
-        confirm_button = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, ".slim-editor-btn.slim-btn-confirm"))
-        )
+        confirm_button = self._wait.until(EC.element_to_be_clickable(CONFIRM_BTN))
         confirm_button.click()
-        time.sleep(2)
+        # The cropper closes once the upload is confirmed; the button is either hidden or removed from the page
+        self._wait.until(EC.invisibility_of_element(confirm_button))
 
     def finalize_card_creation(self):
         """
         Finalizes the card creation process by clicking the 'Next' button on the MTGCardsmith website.
         """
-        next_button = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit'][value='Next']"))
-        )
+        next_button = self._wait.until(EC.element_to_be_clickable(NEXT_BTN))
         next_button.click()
 
     def enter_card_title_and_other_fields(self):
         """
         Enters the card title and other related text fields into the MTGCardsmith card creator form.
-        """
-        self.wait_and_send_keys("//input[@name='name'][@placeholder='Card Title (Required)']", self.card_title)
-
-        if 'mana_value' in self.other_text_fields:
-            self.wait_and_send_keys("//input[@name='custom_mana'][@placeholder='Select your casting cost...']", self.other_text_fields['mana_value'])
-
-        if 'card_type' in self.other_text_fields:
-            print(f"Trying to select card_type")
-            self.select_custom_dropdown_option('s2id_autogen1', self.other_text_fields['card_type'])
-            print(f"Done selecting creature_type")
 
+        Title, mana cost, ability text and rarity are set with a single script; the Select2 card type dropdown cannot be
+        driven that way and still goes through select_custom_dropdown_option.
+        """
         # New approach for handling abilities
+        self.ability_texts = []
         ability_keys = ['static_abilities', 'triggered_abilities_1', 'triggered_abilities_2', 'triggered_abilities_3', 'triggered_abilities_4']
         for key in ability_keys:
             self.process_and_add_ability_text(key)
 
+        self._wait.until(EC.element_to_be_clickable(NAME_INPUT))
+        self.driver.execute_script(self._FILL_FORM_SCRIPT, {
+            'title': self.card_title,
+            'mana': self.other_text_fields.get('mana_value'),
+            'description': '\n'.join(self.ability_texts),
+            'rarity': self.other_text_fields.get('rarity'),
+        })
+
+        if self.other_text_fields.get('card_type'):
+            print(f"Trying to select card_type")
+            self.select_custom_dropdown_option('s2id_autogen1', self.other_text_fields['card_type'])
+            print(f"Done selecting creature_type")
 
     def process_and_add_ability_text(self, ability_key):
         """
@@ -259,7 +723,7 @@ class MTGCardCreator:
     @staticmethod
     def split_ability_text(text, chunk_size):
         """
-        Splits text into chunks of a specified size, attempting to respect word boundaries.
+        Splits text into chunks of a specified size at word boundaries. Words longer than chunk_size are kept whole.
 
         Parameters:
         text (str): The text to split.
@@ -268,23 +732,12 @@ class MTGCardCreator:
         Returns:
         list: A list of text chunks.
         """
-        chunks = [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
-        formatted_chunks = []
-
-        for chunk in chunks:
-            split_index = chunk.rfind(' ')
-            if split_index != -1 and len(chunk) > chunk_size:
-                formatted_chunks.append(chunk[:split_index])
-                formatted_chunks.append(chunk[split_index+1:])
-            else:
-                formatted_chunks.append(chunk)
-
-        return formatted_chunks
+        return textwrap.wrap(text, width=chunk_size, break_long_words=False)
 
     def select_dropdown_option_by_value(self, dropdown_id, value):
         try:
             print(f"Trying to select dropdown")
-            dropdown_element = WebDriverWait(self.driver, 10).until(
+            dropdown_element = WebDriverWait(self.driver, self._DROPDOWN_TIMEOUT).until(
                 EC.visibility_of_element_located((By.ID, dropdown_id))
             )
             select = Select(dropdown_element)
@@ -297,16 +750,9 @@ class MTGCardCreator:
             print(f"An error occurred while selecting {value} from dropdown {dropdown_id}: {e}")
 
 
-    def wait_and_send_keys(self, selector, text, by=By.XPATH):
-        element = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((by, selector))
-        )
-        element.clear()
-        element.send_keys(text)
-
     def select_custom_dropdown_option(self, dropdown_id, option_text):
         # Find and click the <span> element to open the dropdown fully
-        span_element = self.driver.find_element(By.ID, "select2-chosen-2")
+        span_element = self.driver.find_element(*CARD_TYPE_CHOICE)
         span_element.click()
 
         # After clicking the span, click the Select2 box if necessary
@@ -314,9 +760,8 @@ class MTGCardCreator:
         self.driver.execute_script("arguments[0].click();", select2_box)
 
         # Wait for the specific search input to become visible
-        search_input = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located((By.ID, "s2id_autogen2_search"))
-        )
+        dropdown_wait = WebDriverWait(self.driver, self._DROPDOWN_TIMEOUT)
+        search_input = dropdown_wait.until(EC.visibility_of_element_located(CARD_TYPE_SEARCH))
 
         # Type the option text into the specific search box
         search_input.send_keys(option_text)
@@ -324,17 +769,15 @@ class MTGCardCreator:
         # Press Enter key
         search_input.send_keys(Keys.ENTER)
 
-        # Add a short sleep to ensure the selection is processed
-        time.sleep(1)
+        # Wait until Select2 shows the chosen option
+        dropdown_wait.until(EC.text_to_be_present_in_element(CARD_TYPE_CHOICE, option_text))
         print(f"selected creature type")
 
 
     def robust_click(self, selector, by):
-        element = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((by, selector))
-        )
+        element = self._wait.until(EC.element_to_be_clickable((by, selector)))
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(1)
+        element = self._wait.until(EC.element_to_be_clickable((by, selector)))
         try:
             element.click()
         except ElementClickInterceptedException:
@@ -342,15 +785,11 @@ class MTGCardCreator:
 
     def preview_card(self):
         # Click the "Preview Card" button
-        preview_button = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "input[value='Preview Card']"))
-        )
+        preview_button = self._wait.until(EC.element_to_be_clickable(PREVIEW_BTN))
         preview_button.click()
 
         # Wait for the "Publish" button on the new screen
-        publish_button = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "a[href='/src/actions/save']"))
-        )
+        publish_button = self._wait.until(EC.element_to_be_clickable(PUBLISH_BTN))
         publish_button.click()
 
     def run(self):
@@ -363,37 +802,76 @@ class MTGCardCreator:
         self.enter_card_title_and_other_fields()
         self.preview_card()
 
+    def run_with(self, card_info):
+        """
+        Loads a card's details into this instance and creates the card, reusing the existing driver and login.
 
-def main():
-    openai_api_key = openai_api_key
-    google_creds_file = google_creds_file
-    spreadsheet_id = spreadsheet_id
-    folder_id = folder_id
-
-    # Initialize the MTGCardArtCreator with your API keys and IDs
-    art_creator = MTGCardArtCreator(openai_api_key, google_creds_file, spreadsheet_id, folder_id)
+        Parameters:
+        card_info (dict): A card information dictionary as produced by MTGCardArtCreator.
+        """
+        self.image_path = card_info['image_path']
+        self.card_title = card_info['card_title']
+        self.other_text_fields = card_info['other_text_fields']
+        self.run()
 
-    # Generate and upload images based on the spreadsheet data
-    created_cards_info = art_creator.generate_and_upload_images()
 
-    # Check if there are any cards to process
-    if not created_cards_info:
-        print("No cards to create.")
-        return
+def main():
+    parser = argparse.ArgumentParser(description="Generate card art from the 'Cards' sheet and create the cards on MTGCardsmith.")
+    parser.add_argument('--row-start', type=int, default=2, help="first sheet row to process (default: 2, after the header)")
+    parser.add_argument('--row-end', type=int, default=None, help="last sheet row to process (default: end of the sheet)")
+    parser.add_argument('--generate-workers', type=int, default=GENERATE_WORKERS, help=f"DALL·E requests kept in flight (default: {GENERATE_WORKERS})")
+    parser.add_argument('--workers', type=int, default=CARD_WORKERS, help=f"Chrome instances creating cards in parallel (default: {CARD_WORKERS})")
+    args = parser.parse_args()
+    if args.row_start < 2:
+        parser.error("--row-start must be at least 2; row 1 is the header")
+    if args.row_end is not None and args.row_end < args.row_start:
+        parser.error("--row-end must not be before --row-start")
 
-    # Initialize the MTGCardCreator with the first card's details
-    card_creator = MTGCardCreator(created_cards_info[0]['image_path'], created_cards_info[0]['card_title'], created_cards_info[0]['other_text_fields'])
-    card_creator.login()  # Perform login here, before creating any cards
+    # Initialize the MTGCardArtCreator with your API keys and IDs
+    art_creator = MTGCardArtCreator(openai_api_key, google_creds_file, spreadsheet_id, folder_id, row_start=args.row_start, row_end=args.row_end, generate_workers=args.generate_workers)
 
-    # Now, iterate over all cards including the first one, because we're not creating a new instance each time
-    for card_info in created_cards_info:
-        # Update the instance with new card info instead of creating a new instance
-        card_creator.image_path = card_info['image_path']
-        card_creator.card_title = card_info['card_title']
-        card_creator.other_text_fields = card_info['other_text_fields']
+    # Each worker thread lazily starts its own Chrome and logs in once, then reuses it for every card it picks up
+    worker_state = threading.local()
+    card_creators = []
+    card_creators_lock = threading.Lock()
+    worker_ids = itertools.count()  # Numbers each worker's Chrome profile directory
 
-        # Execute the steps to create the card using the existing instance
-        card_creator.run()
+    def process_card(card_info):
+        try:
+            card_creator = getattr(worker_state, 'card_creator', None)
+            if card_creator is None:
+                # Only the profile index is reserved under the lock, so workers start their Chrome instances in parallel
+                with card_creators_lock:
+                    profile_dir = os.path.join(CHROME_PROFILE_DIR, f'worker-{next(worker_ids)}')
+                card_creator = MTGCardCreator(profile_dir=profile_dir)
+                with card_creators_lock:
+                    card_creators.append(card_creator)
+                try:
+                    card_creator.login()
+                except Exception:
+                    # A Chrome that never logged in is of no use to later cards; close it so the next card starts afresh
+                    with card_creators_lock:
+                        card_creators.remove(card_creator)
+                    card_creator.driver.quit()
+                    raise
+                worker_state.card_creator = card_creator
+            card_creator.run_with(card_info)
+        except Exception as e:
+            print(f"Error creating card '{card_info['card_title']}': {e}")
+
+    try:
+        # Cards are handed to Chrome as soon as their art is uploaded, while later rows are still being generated.
+        # The pool only starts a new thread (and Chrome) when no idle worker is available.
+        card_count = 0
+        with ThreadPoolExecutor(max_workers=args.workers) as card_pool:
+            for card_info in art_creator.generate_and_upload_images():
+                card_pool.submit(process_card, card_info)
+                card_count += 1
+        if not card_count:
+            print("No cards to create.")
+    finally:
+        for card_creator in card_creators:
+            card_creator.driver.quit()
 
 if __name__ == "__main__":
     main()